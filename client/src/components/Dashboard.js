@@ -17,7 +17,7 @@ function Dashboard() {
       method: "DELETE",
     };
 
-    let url = `/deleteProfile?email=${storeObj.loginDetails.user.email}`;
+    let url = `/api/deleteProfile?email=${storeObj.loginDetails.user.email}`;
 
     let JSONData = await fetch(url, reqOptions);
 
@@ -45,7 +45,7 @@ function EditProfile() {
       body: dataToSend,
     };
 
-    let JSONData = await fetch("/updateProfile", reqOptions);
+    let JSONData = await fetch("/api/updateProfile", reqOptions);
 
     let JSOData = await JSONData.json();
 
@@ -29,7 +29,7 @@ function Login() {
       body: dataToSend,
     };
 
-    let JSONData = await fetch("/validateToken", reqOptions);
+    let JSONData = await fetch("/api/validateToken", reqOptions);
 
     let JSOData = await JSONData.json();
     console.log(JSOData);
@@ -55,7 +55,7 @@ function Login() {
       body: dataToSend,
     };
 
-    let JSONData = await fetch("/login", reqOptions);
+    let JSONData = await fetch("/api/login", reqOptions);
 
     let JSOData = await JSONData.json();
     console.log(JSOData);
@@ -82,7 +82,7 @@ function Login() {
         body: dataToSend,
       };
 
-      let JSONData = await fetch("/login", reqOptions);
+      let JSONData = await fetch("/api/login", reqOptions);
 
       let JSOData = await JSONData.json();
 
@@ -103,7 +103,7 @@ function Login() {
       dataToSend.append("email", emailInputRef.current.value);
       dataToSend.append("password", passwordInputRef.current.value);
 
-      let response = await axios.post("/login", dataToSend);
+      let response = await axios.post("/api/login", dataToSend);
 
       console.log(response);
 